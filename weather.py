@@ -1,148 +1,501 @@
 #!/usr/bin/env python3
-import requests
-import json
-import argparse
+# requests, argparse, asyncio, json and orjson are imported where they are used so
+# that offline commands like --list-cities start quickly
+import re
 import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
 
-def get_current_weather(latitude, longitude, location_name="Unknown Location", verbose=True):
+# Retry transient server and connection errors with exponential backoff
+# (applied by urllib3 on the requests session and by _fetch_current on aiohttp)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Shared session so repeated lookups reuse a keep-alive connection to the API
+_SESSION = None
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            raise_on_status=False
+        )
+        
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+        session.headers["User-Agent"] = "weather_tool/1.0 (+https://github.com/FrederickMappin/weather_tool)"
+        _SESSION = session
+    return _SESSION
+
+def _check_status(response):
+    """Raise requests.HTTPError for 4xx/5xx responses"""
+    if response.status_code >= 400:
+        import requests
+        raise requests.HTTPError(f"{response.status_code} Error for url: {response.url}", response=response)
+
+_API_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Only the fields the tool displays are requested
+_CURRENT_FIELDS = "temperature_2m,wind_speed_10m,wind_direction_10m,weather_code"
+
+# orjson is optional; it parses and serializes considerably faster than the stdlib
+_orjson = False  # not imported yet
+
+def _get_orjson():
+    """Return the orjson module, or None if it is not installed"""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+def _json_loads(raw):
+    """Parse a JSON response body (bytes)"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+    return json.loads(raw)
+
+def _json_dumps_pretty(data):
+    """Serialize data as indented JSON text"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    import json
+    # Keep non-ASCII text (e.g. "°C") unescaped, as orjson does
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+# Weather code meanings (simplified)
+_WEATHER_DESCRIPTIONS = MappingProxyType({
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy", 
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+})
+# WMO codes are all below 100, so descriptions can be looked up by index
+_WEATHER_TABLE = tuple(_WEATHER_DESCRIPTIONS.get(code) for code in range(100))
+
+# Some common city coordinates (you can expand this)
+_CITY_COORDS = MappingProxyType({
+    'new york': (40.7128, -74.0060),
+    'london': (51.5074, -0.1278),
+    'paris': (48.8566, 2.3522),
+    'tokyo': (35.6762, 139.6503),
+    'sydney': (-33.8688, 151.2093),
+    'los angeles': (34.0522, -118.2437),
+    'chicago': (41.8781, -87.6298),
+    'miami': (25.7617, -80.1918),
+    'berlin': (52.5200, 13.4050),
+    'moscow': (55.7558, 37.6176),
+    'beijing': (39.9042, 116.4074),
+    'mumbai': (19.0760, 72.8777),
+    'toronto': (43.6532, -79.3832),
+    'mexico city': (19.4326, -99.1332),
+    'cairo': (30.0444, 31.2357),
+    'johannesburg': (-26.2041, 28.0473)
+})
+_SORTED_CITIES = sorted(_CITY_COORDS)
+_CITY_LIST_TEXT = "Available cities:\n" + "\n".join(
+    f"  {city.title():<15} ({lat:7.4f}, {lon:8.4f})"
+    for city, (lat, lon) in sorted(_CITY_COORDS.items())
+)
+
+# In-process cache of API responses: (lat, lon) -> (expires_at, etag, last_modified, data)
+# Open-Meteo refreshes current conditions roughly every 15 minutes
+_CACHE = {}
+_TTL = 600
+
+def _cache_key(latitude, longitude):
+    """Cache key for a location, rounded to ~100 m"""
+    return (round(latitude, 3), round(longitude, 3))
+
+def _cache_ttl(headers):
     """
-    Get current weather for a given latitude and longitude using Open-Meteo API
-    No API key required!
+    Cache lifetime for a response, honoring Cache-Control max-age when present
+    Returns None for no-store responses, which must not be cached at all;
+    no-cache responses are stored but revalidated on every use
     """
-    url = f"https://api.open-meteo.com/v1/forecast"
-    params = {
+    cache_control = headers.get('Cache-Control', '')
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+    match = re.search(r'max-age=(\d+)', cache_control)
+    return int(match.group(1)) if match else _TTL
+
+def _cache_fresh(cached):
+    """Whether a cache entry can be used without asking the server"""
+    return cached is not None and time.monotonic() < cached[0]
+
+def _conditional_headers(cached):
+    """Headers that let the server answer 304 Not Modified for an expired entry"""
+    headers = {}
+    if cached:
+        _, etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
+
+def _cache_store(key, cached, status, headers, body):
+    """
+    Cache a forecast response and return its data
+    A 304 reuses the cached body; anything else is parsed and validated first
+    Raises KeyError or ValueError for unusable responses, which are not cached
+    """
+    if status == 304 and cached:
+        # Unchanged: keep the cached body and any validators the 304 omitted
+        _, etag, last_modified, data = cached
+        etag = headers.get('ETag', etag)
+        last_modified = headers.get('Last-Modified', last_modified)
+    else:
+        # Parse the raw body bytes directly, skipping the intermediate str decode
+        data = _json_loads(body)
+        _parse_current(data)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+    ttl = _cache_ttl(headers)
+    if ttl is None:
+        _CACHE.pop(key, None)
+    else:
+        _CACHE[key] = (time.monotonic() + ttl, etag, last_modified, data)
+    return data
+
+def _forecast_params(latitude, longitude):
+    """Query parameters for a current-weather request"""
+    return {
         'latitude': latitude,
         'longitude': longitude,
-        'current_weather': 'true',
+        'current': _CURRENT_FIELDS,
         'timezone': 'auto'
     }
+
+def _parse_current(data):
+    """
+    Extract (temperature, windspeed, winddirection, weathercode, time) from an API response
+    Raises KeyError if the response is missing expected fields
+    """
+    current = data['current']
+    return (
+        current['temperature_2m'],
+        current['wind_speed_10m'],
+        current['wind_direction_10m'],
+        current['weather_code'],
+        current['time']
+    )
+
+def _print_weather(data, latitude, longitude, location_name, verbose):
+    """
+    Display a current-weather API response
+    Raises KeyError if the response is missing expected fields
+    """
+    temperature, windspeed, winddirection, weathercode, observed_at = _parse_current(data)
+    
+    if type(weathercode) is int and 0 <= weathercode < 100:
+        weather_desc = _WEATHER_TABLE[weathercode]
+    else:
+        # Non-integer codes (null, 3.0, ...) take the slower mapping lookup
+        weather_desc = _WEATHER_DESCRIPTIONS.get(weathercode)
+    if weather_desc is None:
+        weather_desc = f"Weather code: {weathercode}"
+    
+    if verbose:
+        sys.stdout.write(
+            f"\n🌤️  Current Weather for {location_name}\n"
+            f"📍 Coordinates: {latitude}, {longitude}\n"
+            f"🌡️  Temperature: {temperature}°C\n"
+            f"🌤️  Condition: {weather_desc}\n"
+            f"💨 Wind: {windspeed} km/h from {winddirection}°\n"
+            f"🕐 Time: {observed_at}\n"
+        )
+    else:
+        # Compact output for scripting
+        print(f"{location_name}: {temperature}°C, {weather_desc}, Wind: {windspeed}km/h")
+
+def get_current_weather(latitude, longitude, location_name="Unknown Location", verbose=True):
+    """
+    Get current weather for a given latitude and longitude using Open-Meteo API
+    No API key required!
+    """
+    key = _cache_key(latitude, longitude)
+    cached = _CACHE.get(key)
+    if _cache_fresh(cached):
+        # Only responses that parsed successfully are cached
+        _print_weather(cached[3], latitude, longitude, location_name, verbose)
+        return cached[3]
+    
+    import requests
+    
+    params = _forecast_params(latitude, longitude)
+    headers = _conditional_headers(cached)
     
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()  # Raises an HTTPError for bad responses
-        
-        data = response.json()
-        current_weather = data['current_weather']
-        
-        # Parse and display weather information
-        temperature = current_weather['temperature']
-        windspeed = current_weather['windspeed']
-        winddirection = current_weather['winddirection']
-        weathercode = current_weather['weathercode']
-        
-        # Weather code meanings (simplified)
-        weather_descriptions = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy", 
-            3: "Overcast",
-            45: "Fog",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
-        }
-        
-        weather_desc = weather_descriptions.get(weathercode, f"Weather code: {weathercode}")
-        
-        if verbose:
-            print(f"\n🌤️  Current Weather for {location_name}")
-            print(f"📍 Coordinates: {latitude}, {longitude}")
-            print(f"🌡️  Temperature: {temperature}°C")
-            print(f"🌤️  Condition: {weather_desc}")
-            print(f"💨 Wind: {windspeed} km/h from {winddirection}°")
-            print(f"🕐 Time: {current_weather['time']}")
-        else:
-            # Compact output for scripting
-            print(f"{location_name}: {temperature}°C, {weather_desc}, Wind: {windspeed}km/h")
+        response = _get_session().get(_API_URL, params=params, headers=headers, timeout=10)
+        _check_status(response)
         
+        data = _cache_store(key, cached, response.status_code, response.headers, response.content)
+        _print_weather(data, latitude, longitude, location_name, verbose)
         return data
         
     except requests.exceptions.RequestException as e:
         print(f"❌ Error fetching weather data: {e}", file=sys.stderr)
         return None
-    except KeyError as e:
+    except (KeyError, ValueError) as e:
         print(f"❌ Error parsing weather data: {e}", file=sys.stderr)
         return None
 
-def get_weather_by_city(city_name, verbose=True):
+async def _fetch_current(session, latitude, longitude, location_name=None):
     """
-    Get weather by city name (requires geocoding)
-    This is a simple example - you might want to use a proper geocoding service
+    Fetch current weather for one location on an aiohttp session
+    Shares the TTL cache, conditional requests and retry policy of get_current_weather
+    Returns the raw API response, or None on errors (reported using location_name)
     """
-    # Some common city coordinates (you can expand this)
-    city_coords = {
-        'new york': (40.7128, -74.0060),
-        'london': (51.5074, -0.1278),
-        'paris': (48.8566, 2.3522),
-        'tokyo': (35.6762, 139.6503),
-        'sydney': (-33.8688, 151.2093),
-        'los angeles': (34.0522, -118.2437),
-        'chicago': (41.8781, -87.6298),
-        'miami': (25.7617, -80.1918),
-        'berlin': (52.5200, 13.4050),
-        'moscow': (55.7558, 37.6176),
-        'beijing': (39.9042, 116.4074),
-        'mumbai': (19.0760, 72.8777),
-        'toronto': (43.6532, -79.3832),
-        'mexico city': (19.4326, -99.1332),
-        'cairo': (30.0444, 31.2357),
-        'johannesburg': (-26.2041, 28.0473)
+    import asyncio
+    import aiohttp
+    
+    label = location_name or f"({latitude}, {longitude})"
+    key = _cache_key(latitude, longitude)
+    cached = _CACHE.get(key)
+    if _cache_fresh(cached):
+        return cached[3]
+    
+    params = _forecast_params(latitude, longitude)
+    headers = _conditional_headers(cached)
+    
+    try:
+        for attempt in range(_RETRY_TOTAL + 1):
+            try:
+                async with session.get(_API_URL, params=params, headers=headers) as response:
+                    if response.status not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                        response.raise_for_status()
+                        return _cache_store(key, cached, response.status, response.headers, await response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == _RETRY_TOTAL:
+                    raise
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"❌ Error fetching weather data for {label}: {e}", file=sys.stderr)
+        return None
+    except (KeyError, ValueError) as e:
+        print(f"❌ Error parsing weather data for {label}: {e}", file=sys.stderr)
+        return None
+
+def _client_session():
+    """Create an aiohttp session with a pooled connector (must be called inside an event loop)"""
+    import aiohttp
+    
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10),
+        connector=aiohttp.TCPConnector(limit=10)
+    )
+
+async def get_many(locations, names=None, on_result=None):
+    """
+    Fetch current weather for several (latitude, longitude) pairs concurrently
+    names are used in error messages; on_result(index, data) is called as each response arrives
+    Returns the raw API responses in the same order (None for failed lookups)
+    """
+    import asyncio
+    
+    if names is None:
+        names = [None] * len(locations)
+    
+    async def fetch(session, index, latitude, longitude):
+        data = await _fetch_current(session, latitude, longitude, names[index])
+        if on_result is not None:
+            on_result(index, data)
+        return data
+    
+    async with _client_session() as session:
+        return await asyncio.gather(*[
+            fetch(session, index, lat, lon) for index, (lat, lon) in enumerate(locations)
+        ])
+
+_GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+
+def _normalize_city(city_name):
+    """Normalize a city name for lookup (case and whitespace insensitive)"""
+    return " ".join(city_name.casefold().split())
+
+# Lookup table keyed by normalized name; geocoding results are added on demand
+_CITY_COORDS_NORM = {_normalize_city(city): coords for city, coords in _CITY_COORDS.items()}
+
+# City names already known to be missing, so repeated misses skip the lookup
+_MISS_SET = set()
+
+def _geocode_city(city_name):
+    """
+    Look up a city with the Open-Meteo geocoding API
+    Returns (latitude, longitude) of the best match, or None if nothing matched
+    """
+    params = {
+        'name': city_name,
+        'count': 1
     }
+    response = _get_session().get(_GEOCODING_URL, params=params, timeout=10)
+    _check_status(response)
     
-    city_lower = city_name.lower()
-    if city_lower in city_coords:
-        lat, lon = city_coords[city_lower]
-        return get_current_weather(lat, lon, city_name.title(), verbose)
-    else:
-        print(f"❌ City '{city_name}' not found in database.", file=sys.stderr)
-        if verbose:
-            print("Available cities:", ", ".join(sorted(city_coords.keys())), file=sys.stderr)
+    payload = _json_loads(response.content)
+    if not isinstance(payload, dict):
+        raise ValueError(f"unexpected geocoding response: {payload!r:.80}")
+    
+    results = payload.get('results')
+    if not results:
+        return None
+    return (results[0]['latitude'], results[0]['longitude'])
+
+def _resolve_city(city_name):
+    """
+    Resolve a city name to (latitude, longitude)
+    Checks the built-in table first and falls back to geocoding, memoizing both hits and misses
+    Returns None if the city is unknown; network errors are raised to the caller
+    """
+    key = _normalize_city(city_name)
+    if key in _MISS_SET:
+        return None
+    
+    coords = _CITY_COORDS_NORM.get(key)
+    if coords is None:
+        coords = _geocode_city(city_name)
+        if coords is None:
+            _MISS_SET.add(key)
+            return None
+        _CITY_COORDS_NORM[key] = coords
+    return coords
+
+def _lookup_city(city_name, verbose=True):
+    """
+    Resolve a city name to (latitude, longitude), reporting failures on stderr
+    Returns None if the city is unknown or the lookup failed
+    """
+    # Built-in and previously geocoded cities need no network access
+    coords = _CITY_COORDS_NORM.get(_normalize_city(city_name))
+    if coords is not None:
+        return coords
+    
+    import requests
+    
+    already_missed = _normalize_city(city_name) in _MISS_SET
+    try:
+        coords = _resolve_city(city_name)
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Error looking up city '{city_name}': {e}", file=sys.stderr)
+        return None
+    except (KeyError, ValueError) as e:
+        print(f"❌ Error parsing geocoding data: {e}", file=sys.stderr)
+        return None
+    
+    if coords is None:
+        print(f"❌ City '{city_name}' not found.", file=sys.stderr)
+        if verbose and not already_missed:
+            print("Built-in cities:", ", ".join(_SORTED_CITIES), file=sys.stderr)
+    return coords
+
+def _display_name(city_name):
+    """Title-cased city name with whitespace collapsed"""
+    return " ".join(city_name.split()).title()
+
+def get_weather_by_city(city_name, verbose=True):
+    """
+    Get weather by city name
+    Uses the built-in city table, falling back to Open-Meteo geocoding for other cities
+    """
+    coords = _lookup_city(city_name, verbose)
+    if coords is None:
         return None
+    
+    lat, lon = coords
+    return get_current_weather(lat, lon, _display_name(city_name), verbose)
+
+def get_weather_for_cities(city_names, verbose=True):
+    """
+    Get weather for several cities at once, fetching them concurrently with aiohttp
+    Falls back to one request at a time when aiohttp is not installed
+    Returns {city name: data} for the cities that succeeded, in the order given
+    """
+    import asyncio
+    
+    names = []
+    locations = []
+    seen = set()
+    for city_name in city_names:
+        # Each city is fetched and printed once, however it was spelled
+        key = _normalize_city(city_name)
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        coords = _lookup_city(city_name, verbose)
+        if coords is not None:
+            names.append(_display_name(city_name))
+            locations.append(coords)
+    
+    try:
+        import aiohttp  # noqa: F401 -- only checking that it is available
+    except ImportError:
+        if verbose:
+            print("💡 Install aiohttp to fetch several cities concurrently", file=sys.stderr)
+        responses = [get_current_weather(lat, lon, name, verbose) for name, (lat, lon) in zip(names, locations)]
+    else:
+        def show(index, data):
+            # Print each result as soon as it arrives
+            if data is not None:
+                lat, lon = locations[index]
+                _print_weather(data, lat, lon, names[index], verbose)
+        
+        responses = asyncio.run(get_many(locations, names, show)) if locations else []
+    
+    return {name: data for name, data in zip(names, responses) if data is not None}
 
 def list_cities():
     """List all available cities"""
-    city_coords = {
-        'new york': (40.7128, -74.0060),
-        'london': (51.5074, -0.1278),
-        'paris': (48.8566, 2.3522),
-        'tokyo': (35.6762, 139.6503),
-        'sydney': (-33.8688, 151.2093),
-        'los angeles': (34.0522, -118.2437),
-        'chicago': (41.8781, -87.6298),
-        'miami': (25.7617, -80.1918),
-        'berlin': (52.5200, 13.4050),
-        'moscow': (55.7558, 37.6176),
-        'beijing': (39.9042, 116.4074),
-        'mumbai': (19.0760, 72.8777),
-        'toronto': (43.6532, -79.3832),
-        'mexico city': (19.4326, -99.1332),
-        'cairo': (30.0444, 31.2357),
-        'johannesburg': (-26.2041, 28.0473)
-    }
-    
-    print("Available cities:")
-    for city in sorted(city_coords.keys()):
-        lat, lon = city_coords[city]
-        print(f"  {city.title():<15} ({lat:7.4f}, {lon:8.4f})")
+    sys.stdout.write(_CITY_LIST_TEXT + "\n")
 
 def main():
+    # Fast path: listing cities needs neither argparse nor the network
+    if len(sys.argv) == 2 and sys.argv[1] in ('-l', '--list-cities'):
+        list_cities()
+        return 0
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Get current weather information using the Open-Meteo API",
         epilog="Examples:\n"
                "  %(prog)s --city London\n"
                "  %(prog)s --coords 40.7128 -74.0060 --name \"New York\"\n"
                "  %(prog)s --city Tokyo --compact\n"
+               "  %(prog)s --city London Tokyo Paris\n"
                "  %(prog)s --list-cities",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -152,7 +505,9 @@ def main():
     
     location_group.add_argument(
         '--city', '-c',
-        help='Get weather for a city by name'
+        nargs='+',
+        metavar='CITY',
+        help='Get weather for one or more cities by name (multiple cities are fetched concurrently)'
     )
     
     location_group.add_argument(
@@ -198,9 +553,14 @@ def main():
     
     # Get weather data
     weather_data = None
+    complete = True
     
-    if args.city:
-        weather_data = get_weather_by_city(args.city, verbose)
+    if args.city and len(args.city) > 1:
+        weather_data = get_weather_for_cities(args.city, verbose)
+        # Partial results are still shown, but failures are reflected in the exit code
+        complete = len(weather_data) == len({_normalize_city(city) for city in args.city})
+    elif args.city:
+        weather_data = get_weather_by_city(args.city[0], verbose)
     elif args.coords:
         lat, lon = args.coords
         location_name = args.name or f"Coordinates ({lat}, {lon})"
@@ -208,10 +568,12 @@ def main():
     
     # Handle JSON output
     if args.json and weather_data:
-        print(json.dumps(weather_data, indent=2))
+        print(_json_dumps_pretty(weather_data))
     
     # Return exit code
-    return 0 if weather_data else 1
+    return 0 if weather_data and complete else 1
+
+_PROMPT = "\nChoose option:\n1. Get weather by coordinates\n2. Get weather by city\n3. Exit\nEnter choice (1-3): "
 
 def interactive_mode():
     """Legacy interactive mode for backwards compatibility"""
@@ -220,7 +582,8 @@ def interactive_mode():
     print("    Example: python weather.py --city London")
     
     # Get weather for New York City
-    get_current_weather(40.7128, -74.0060, "New York City")
+    lat, lon = _CITY_COORDS['new york']
+    get_current_weather(lat, lon, "New York City")
     
     # Get weather by city name
     get_weather_by_city("London")
@@ -230,7 +593,7 @@ def interactive_mode():
     print("Interactive Mode:")
     
     while True:
-        choice = input("\nChoose option:\n1. Get weather by coordinates\n2. Get weather by city\n3. Exit\nEnter choice (1-3): ")
+        choice = input(_PROMPT)
         
         if choice == "1":
             try: